@@ -7,6 +7,8 @@ Usage:
     python batch_stories.py "stories/*.md"         # glob pattern
 """
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Unbuffered output so progress is visible when stdout is redirected
@@ -54,46 +56,89 @@ def main() -> None:
     if use_placeholders:
         print("WARNING: No HF_TOKEN — using placeholders (images will be grey)")
 
-    print(f"\nFound {len(md_files)} story file(s)\n")
+    workers = max(1, min(config.max_parallel, len(md_files)))
+    parallel_note = f", rendering {workers} at a time" if workers > 1 else ""
+    print(f"\nFound {len(md_files)} story file(s){parallel_note}\n")
 
     ok = 0
     failed = 0
+    pipelines: set[Pipeline] = set()
+    lock = threading.Lock()
+    # Set on Ctrl-C so queued files that slip past cancel_futures bail out
+    cancelled = threading.Event()
 
-    for idx, md_path in enumerate(md_files, 1):
-        print(f"\n{'='*60}")
-        print(f"[{idx}/{len(md_files)}] {md_path.name}")
-        print(f"{'='*60}")
+    def _render(idx: int, md_path: Path) -> Path:
+        if cancelled.is_set():
+            raise PipelineCancelled
+        # Tag every line with the file when several run at once
+        tag = f"{md_path.stem} │ " if workers > 1 else ""
 
         try:
             text = md_path.read_text(encoding="utf-8")
             title, scenes, settings = parse_markdown_story(text)
-            print(f"  Title : {title or '(untitled)'}")
-            print(f"  Scenes: {len(scenes)}, ~{sum(s.duration for s in scenes):.0f}s total")
-            print(f"  Music : {settings.music_style}")
-            print(f"  Voice : {settings.voice} (rate {settings.voice_rate}, pitch {settings.voice_pitch})")
         except Exception as e:
-            print(f"  ERROR (parse): {e}")
-            failed += 1
-            continue
+            # The header below isn't printed yet, so name the file here
+            print(f"{tag}  ERROR (parse) [{idx}/{len(md_files)}] {md_path.name}: {e}")
+            raise
+
+        # One print call so the header block can't interleave with other files
+        print(
+            f"\n{'='*60}\n"
+            f"[{idx}/{len(md_files)}] {md_path.name}\n"
+            f"{'='*60}\n"
+            f"{tag}  Title : {title or '(untitled)'}\n"
+            f"{tag}  Scenes: {len(scenes)}, ~{sum(s.duration for s in scenes):.0f}s total\n"
+            f"{tag}  Music : {settings.music_style}\n"
+            f"{tag}  Voice : {settings.voice} (rate {settings.voice_rate}, pitch {settings.voice_pitch})"
+        )
 
         pipeline = Pipeline(
             config=config,
-            progress_cb=lambda msg: print(f"  {msg}"),
+            progress_cb=lambda msg: print(f"{tag}  {msg}"),
             use_placeholders=use_placeholders,
         )
         pipeline.inject_scenes(scenes, settings=settings)
-
+        with lock:
+            if cancelled.is_set():
+                raise PipelineCancelled
+            pipelines.add(pipeline)
         try:
-            output = pipeline.run(title or md_path.stem)
-            print(f"\n  Saved: {output}")
-            ok += 1
+            return pipeline.run(title or md_path.stem)
         except PipelineCancelled:
-            print("  Cancelled by user.")
-            break
+            raise
         except Exception as e:
-            print(f"  ERROR (pipeline): {e}")
-            failed += 1
-            continue
+            print(f"{tag}  ERROR (pipeline): {e}")
+            raise
+        finally:
+            with lock:
+                pipelines.discard(pipeline)
+
+    # Bounded pool: HF rate limits and RAM, not CPU, cap useful parallelism
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vidgen-batch")
+    futures: dict[Future, Path] = {
+        pool.submit(_render, idx, md_path): md_path
+        for idx, md_path in enumerate(md_files, 1)
+    }
+    try:
+        for future in as_completed(futures):
+            try:
+                output = future.result()
+            except PipelineCancelled:
+                continue
+            except Exception:
+                failed += 1
+                continue
+            print(f"\n  Saved: {output}")
+            ok += 1
+    except KeyboardInterrupt:
+        print("\n  Cancelled by user.")
+        with lock:
+            cancelled.set()
+            for pipeline in pipelines:
+                pipeline.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+    else:
+        pool.shutdown()
 
     print(f"\n{'='*60}")
     print(f"Done: {ok} succeeded, {failed} failed.")
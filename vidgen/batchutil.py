@@ -5,9 +5,22 @@ Used by both the CLI (batch_stories.py) and the TUI (tui.py).
 from __future__ import annotations
 
 import glob as _glob
+import os
 from pathlib import Path
 
 
+def _md_files_in(directory: Path) -> list[Path]:
+    """Sorted ``*.md`` files directly inside *directory*.
+
+    One scandir pass; DirEntry answers is_file() from the directory listing
+    itself, so no per-entry stat is needed on most filesystems.
+    """
+    with os.scandir(directory) as it:
+        names = [e.name for e in it if e.name.endswith(".md") and e.is_file()]
+    names.sort()
+    return [directory / n for n in names]
+
+
 def resolve_md_paths(raw: str, sep: str = ",") -> list[Path]:
     """Expand a string of paths into a deduplicated, sorted list of .md files.
 
@@ -37,7 +50,7 @@ def resolve_md_paths(raw: str, sep: str = ",") -> list[Path]:
             for m in matches:
                 p = Path(m).resolve()
                 if p.is_dir():
-                    files.extend(sorted(p.glob("*.md")))
+                    files.extend(_md_files_in(p))
                 elif p.is_file() and p.suffix.lower() == ".md":
                     files.append(p)
         else:
@@ -45,17 +58,11 @@ def resolve_md_paths(raw: str, sep: str = ",") -> list[Path]:
             p = Path(expanded_token).resolve()
             if p.is_dir():
                 # Directory exists but contains no .md files
-                files.extend(sorted(p.glob("*.md")))
+                files.extend(_md_files_in(p))
             elif p.suffix.lower() == ".md":
                 print(f"  WARNING: file not found: {p}")
             else:
                 print(f"  WARNING: skipping unrecognised path: {token}")
 
     # Deduplicate while preserving order
-    seen: set[Path] = set()
-    unique: list[Path] = []
-    for f in files:
-        if f not in seen:
-            seen.add(f)
-            unique.append(f)
-    return unique
+    return list(dict.fromkeys(files))
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import os
+import random
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -27,6 +28,7 @@ API_IMAGE_HEIGHT = 1024
 
 # Video generation (image-to-video)
 VIDEO_MODEL = "stabilityai/stable-video-diffusion-img2vid-xt"
+MAX_CONCURRENT_HF = 4  # image-to-video requests in flight at once
 
 # Ken Burns
 KB_ZOOM_MIN = 1.0
@@ -41,9 +43,18 @@ NARRATION_LEAD_IN = 0.6         # silence before speech starts (seconds)
 NARRATION_PADDING_AFTER = 1.0   # silence after speech ends (seconds)
 # Total scene duration = lead_in + speech_duration + padding_after
 
-# Retry
+# Retry — exponential backoff with jitter so parallel workers that fail
+# together don't hammer the API again in lockstep
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_DELAY = 2.0        # seconds, first wait
+RETRY_BACKOFF = 1.5      # multiplier per attempt
+RETRY_DELAY_MAX = 30.0   # seconds, cap before jitter
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait after failed attempt number `attempt` (1-based)."""
+    delay = min(RETRY_DELAY * RETRY_BACKOFF ** (attempt - 1), RETRY_DELAY_MAX)
+    return delay + random.uniform(0, 0.5 * delay)
 
 
 @dataclass
@@ -51,26 +62,40 @@ class Config:
     hf_token: str = ""
     output_dir: Path = field(default_factory=lambda: Path("output"))
     bg_music: str | None = None  # path to background music file
+    max_parallel: int = 2  # markdown files processed at once (HF rate limits)
 
     @classmethod
     def load(cls) -> "Config":
         """Load config from env vars then config file."""
         cfg = cls()
 
-        # Env var takes priority
+        # Env var takes priority for the token; other keys always come from
+        # the config file
         token = os.environ.get("HF_TOKEN", "")
 
-        # Fall back to config file
-        if not token and CONFIG_FILE.exists():
+        data: dict = {}
+        if CONFIG_FILE.exists():
             try:
                 data = json.loads(CONFIG_FILE.read_text())
-                token = data.get("hf_token", "")
-                if music := data.get("bg_music"):
-                    cfg.bg_music = music
-                if out := data.get("output_dir"):
-                    cfg.output_dir = Path(out)
             except (json.JSONDecodeError, OSError):
                 pass
+        if not isinstance(data, dict):
+            data = {}
+
+        if not token:
+            token = data.get("hf_token", "")
+        if music := data.get("bg_music"):
+            cfg.bg_music = music
+        if out := data.get("output_dir"):
+            cfg.output_dir = Path(out)
+        if "max_parallel" in data:
+            parallel = data["max_parallel"]
+            if isinstance(parallel, bool) or not isinstance(parallel, int) or parallel < 1:
+                raise ValueError(
+                    f"max_parallel in {CONFIG_FILE} must be a positive integer, "
+                    f"got {parallel!r}"
+                )
+            cfg.max_parallel = parallel
 
         cfg.hf_token = token
         return cfg
@@ -16,9 +16,9 @@ from .config import (
     HEIGHT,
     MAX_RETRIES,
     PRIMARY_IMAGE_MODEL,
-    RETRY_DELAY,
     WIDTH,
     Config,
+    retry_delay,
 )
 
 log = logging.getLogger(__name__)
@@ -34,6 +34,8 @@ def _call_hf_image(
     """Call HF Inference API for text-to-image. Returns raw image bytes."""
     from huggingface_hub import InferenceClient
 
+    # Cheap to build: requests go through huggingface_hub's process-wide
+    # HTTP session, so connections are pooled across scenes regardless
     client = InferenceClient(model=model, token=token)
     img: Image.Image = client.text_to_image(
         prompt,
@@ -81,7 +83,7 @@ def generate_image(
                 if progress_cb:
                     progress_cb(f"  ⚠ Failed ({model} attempt {attempt}): {e}")
                 if attempt < MAX_RETRIES:
-                    time.sleep(RETRY_DELAY)
+                    time.sleep(retry_delay(attempt))
 
         if progress_cb:
             progress_cb(f"  ⚠ All retries exhausted for {model}, trying fallback...")
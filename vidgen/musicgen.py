@@ -155,11 +155,16 @@ def _vibrato_tone(freq: float, duration: float, rate: float = 5.5,
     return np.sin(phase).astype(np.float32)
 
 
-def _normalize(signal: np.ndarray, peak: float = 0.78) -> np.ndarray:
-    m = np.max(np.abs(signal))
-    if m > 0:
-        return (signal / m * peak).astype(np.float32)
-    return signal
+def _to_pcm16(signal: np.ndarray, peak: float = 0.78, n_samples: int | None = None) -> np.ndarray:
+    """Peak-normalise *signal* and convert it to 16-bit PCM in one scaling pass.
+
+    The peak is measured over the whole signal; only the first *n_samples*
+    are scaled and returned.
+    """
+    m = max(float(signal.max()), -float(signal.min()))
+    scale = peak * 32767 / m if m > 0 else 32767
+    out = signal[:n_samples] * scale
+    return out.astype(np.int16)
 
 
 # ---------------------------------------------------------------------------
@@ -366,15 +371,14 @@ def generate_music(
 
     mix = erhu + guzheng + dizi + drone
     mix *= _dynamics_envelope(len(mix))
-    mix = _normalize(mix, peak=0.78)
-    mix = mix[:int(SR * duration)]
+    pcm = _to_pcm16(mix, peak=0.78, n_samples=int(SR * duration))
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with wave.open(str(output_path), "w") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)   # 16-bit PCM
         wf.setframerate(SR)
-        wf.writeframes((mix * 32767).astype(np.int16).tobytes())
+        wf.writeframes(pcm.tobytes())
 
     if progress_cb:
         size_kb = output_path.stat().st_size // 1024
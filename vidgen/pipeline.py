@@ -16,7 +16,7 @@ from .musicgen import generate_music
 from .scriptgen import Scene, StorySettings, generate_script, parse_markdown_story, parse_user_story, script_to_json
 from .story_agent import review_and_refine
 from .ttsgen import generate_narration_track, sync_scene_durations_to_narration
-from .videogen import generate_placeholder_video, generate_video
+from .videogen import generate_placeholder_videos_batch, generate_videos_batch
 
 log = logging.getLogger(__name__)
 
@@ -168,27 +168,35 @@ class Pipeline:
         self._check_cancel()
 
         tmp = Path(self._tmpdir)
+        video_scenes = [s for s in video_scenes if s.index in media_paths]
 
-        for scene in video_scenes:
-            self._check_cancel()
-            if scene.index not in media_paths:
-                continue
+        image_paths = [media_paths[s.index] for s in video_scenes]
+        output_paths = [tmp / f"scene_{s.index:03d}.mp4" for s in video_scenes]
 
-            img_path = media_paths[scene.index]
-            vid_path = tmp / f"scene_{scene.index:03d}.mp4"
-            self.progress_cb(f"  Animating scene {scene.index}...")
+        if self.use_placeholders or not self.config.hf_token:
+            # A few placeholder clips per ffmpeg process
+            self.progress_cb(f"  Rendering {len(video_scenes)} placeholder clips...")
+            results = generate_placeholder_videos_batch(
+                image_paths, output_paths, [s.duration for s in video_scenes],
+                is_cancelled=self._cancelled.is_set,
+            )
+            suffix = " (placeholder)"
+        else:
+            # HF image-to-video is pure network wait — animate every scene at once
+            results = generate_videos_batch(
+                image_paths, output_paths, self.config, self.progress_cb,
+                is_cancelled=self._cancelled.is_set,
+            )
+            suffix = ""
+        self._check_cancel()
 
-            try:
-                if self.use_placeholders or not self.config.hf_token:
-                    generate_placeholder_video(img_path, vid_path, duration=scene.duration)
-                    self.progress_cb(f"  ✓ Scene {scene.index} animated (placeholder)")
-                else:
-                    generate_video(img_path, vid_path, self.config, self.progress_cb)
-                    self.progress_cb(f"  ✓ Scene {scene.index} animated")
-                media_paths[scene.index] = vid_path
-            except Exception as e:
-                self.progress_cb(f"  ⚠ Animation failed for scene {scene.index}: {e}")
-                log.warning("Video gen failed for scene %d, keeping image: %s", scene.index, e)
+        for scene, result in zip(video_scenes, results):
+            if isinstance(result, BaseException):
+                self.progress_cb(f"  ⚠ Animation failed for scene {scene.index}: {result}")
+                log.warning("Video gen failed for scene %d, keeping image: %s", scene.index, result)
+            else:
+                self.progress_cb(f"  ✓ Scene {scene.index} animated{suffix}")
+                media_paths[scene.index] = result
 
         return media_paths
 
@@ -265,16 +273,31 @@ class Pipeline:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_dir = Path(self.config.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Reserve a unique name: pipelines running in parallel can finish
+        # within the same second.
         output_path = output_dir / f"vidgen_{timestamp}.mp4"
+        n = 1
+        while True:
+            try:
+                output_path.touch(exist_ok=False)
+                break
+            except FileExistsError:
+                output_path = output_dir / f"vidgen_{timestamp}_{n}.mp4"
+                n += 1
 
-        compile_video(
-            scenes=self._scenes,
-            media_paths=media_paths,
-            output_path=output_path,
-            bg_music=bg_music or self.config.bg_music,
-            narration=narration,
-            progress_cb=self.progress_cb,
-        )
+        try:
+            compile_video(
+                scenes=self._scenes,
+                media_paths=media_paths,
+                output_path=output_path,
+                bg_music=bg_music or self.config.bg_music,
+                narration=narration,
+                progress_cb=self.progress_cb,
+            )
+        except BaseException:
+            output_path.unlink(missing_ok=True)
+            raise
 
         return output_path
 
@@ -29,7 +29,7 @@ VOICE_PRESETS: dict[str, tuple[str, str, str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class StorySettings:
     """Per-story audio settings parsed from the markdown preamble.
 
@@ -47,7 +47,7 @@ class StorySettings:
     voice_pitch: str = "-5Hz"
 
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     index: int
     narration: str
@@ -131,15 +131,16 @@ _TEMPLATES: list[dict] = [
 ]
 
 
+_PROMPT_PREFIX_RE = re.compile(
+    r"^(make|create|generate|build|produce)\s+(a\s+)?([\w\s]*?\s+)?(video|short|clip|content)\s+(about|on|for|of)\s+",
+    re.IGNORECASE,
+)
+
+
 def _extract_topic(prompt: str) -> str:
     """Extract the main topic from a user prompt."""
     # Strip common prefixes
-    cleaned = re.sub(
-        r"^(make|create|generate|build|produce)\s+(a\s+)?([\w\s]*?\s+)?(video|short|clip|content)\s+(about|on|for|of)\s+",
-        "",
-        prompt.strip(),
-        flags=re.IGNORECASE,
-    )
+    cleaned = _PROMPT_PREFIX_RE.sub("", prompt.strip())
     return cleaned.strip() or prompt.strip()
 
 
@@ -197,6 +198,25 @@ def script_to_json(scenes: list[Scene]) -> str:
     return json.dumps([s.to_dict() for s in scenes], indent=2)
 
 
+# Markdown story parsing — compiled once, used per line
+_SECTION_RE = re.compile(r"^##\s+", re.MULTILINE)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_LIST_MARKER_RE = re.compile(r"^[-*]\s+")
+_BOLD_RE = re.compile(r"\*+")
+_HEADING_META_RE = re.compile(r"\(([^)]+)\)")
+_NON_NUMERIC_RE = re.compile(r"[^0-9.]")
+# "Key: value" lines: one anchored match picks the field, so lines that set
+# nothing (most prose and notes) cost a single failed match instead of a
+# lower() copy plus a startswith chain
+_SETTING_FIELD_RE = re.compile(r"(music|voice-rate|voice-pitch|voice):", re.IGNORECASE)
+_SCENE_FIELD_RE = re.compile(r"(narration|visual|duration|type):", re.IGNORECASE)
+
+
+def _clean_md_line(line: str) -> str:
+    """Strip surrounding whitespace, a leading list marker and bold markers."""
+    return _BOLD_RE.sub("", _LIST_MARKER_RE.sub("", line.strip()))
+
+
 def parse_markdown_story(text: str) -> tuple[str, list[Scene], StorySettings]:
     """Parse a markdown story file into a ``(title, scenes, settings)`` triple.
 
@@ -252,8 +272,7 @@ def parse_markdown_story(text: str) -> tuple[str, list[Scene], StorySettings]:
             break
 
     # Split on ## headings
-    section_re = re.compile(r"^##\s+", re.MULTILINE)
-    parts = section_re.split(text)
+    parts = _SECTION_RE.split(text)
 
     if len(parts) <= 1:
         # No ## headings — fall back to pipe-separated format
@@ -267,24 +286,26 @@ def parse_markdown_story(text: str) -> tuple[str, list[Scene], StorySettings]:
     _pitch_override: str | None = None
 
     # Strip HTML comments (<!-- ... -->) so template doc blocks don't interfere
-    preamble = re.sub(r"<!--.*?-->", "", parts[0], flags=re.DOTALL)
+    preamble = _HTML_COMMENT_RE.sub("", parts[0])
 
     for raw in preamble.splitlines():
-        line = re.sub(r"^[-*]\s+", "", raw.strip())  # strip list markers
-        line = re.sub(r"\*+", "", line)               # strip bold markers
-        lower = line.lower()
+        line = _clean_md_line(raw)  # strip list and bold markers
+        m = _SETTING_FIELD_RE.match(line)
+        if not m:
+            continue
+        key = m.group(1).lower()
+        val = line[m.end():].strip()
 
-        if lower.startswith("music:"):
-            settings.music_style = line[len("music:"):].strip()
+        if key == "music":
+            settings.music_style = val
 
-        elif lower.startswith("voice-rate:"):
-            _rate_override = line[len("voice-rate:"):].strip()
+        elif key == "voice-rate":
+            _rate_override = val
 
-        elif lower.startswith("voice-pitch:"):
-            _pitch_override = line[len("voice-pitch:"):].strip()
+        elif key == "voice-pitch":
+            _pitch_override = val
 
-        elif lower.startswith("voice:"):
-            val = line[len("voice:"):].strip()
+        else:  # voice
             preset = VOICE_PRESETS.get(val.lower())
             if preset:
                 settings.voice, settings.voice_rate, settings.voice_pitch = preset
@@ -306,7 +327,7 @@ def parse_markdown_story(text: str) -> tuple[str, list[Scene], StorySettings]:
         # Parse (duration, type) hints from heading, e.g. "Scene 2 (10s, video)"
         duration = 10.0
         media_type = "image"
-        heading_meta = re.search(r"\(([^)]+)\)", heading)
+        heading_meta = _HEADING_META_RE.search(heading)
         if heading_meta:
             for chunk in heading_meta.group(1).split(","):
                 chunk = chunk.strip().lower()
@@ -328,23 +349,24 @@ def parse_markdown_story(text: str) -> tuple[str, list[Scene], StorySettings]:
 
         for line in section_lines[1:]:
             # Strip list markers and bold markdown syntax
-            clean = re.sub(r"^[-*]\s+", "", line.strip())
-            clean = re.sub(r"\*+", "", clean)
-            lower = clean.lower()
-
-            if lower.startswith("narration:"):
-                narration = clean[len("narration:"):].strip()
-            elif lower.startswith("visual:"):
-                visual = clean[len("visual:"):].strip()
-            elif lower.startswith("duration:"):
+            clean = _clean_md_line(line)
+            m = _SCENE_FIELD_RE.match(clean)
+            if not m:
+                continue
+            key = m.group(1).lower()
+            val = clean[m.end():].strip()
+
+            if key == "narration":
+                narration = val
+            elif key == "visual":
+                visual = val
+            elif key == "duration":
                 try:
-                    duration = float(
-                        re.sub(r"[^0-9.]", "", clean[len("duration:"):].strip())
-                    )
+                    duration = float(_NON_NUMERIC_RE.sub("", val))
                 except ValueError:
                     pass
-            elif lower.startswith("type:"):
-                t = clean[len("type:"):].strip().lower()
+            else:  # type
+                t = val.lower()
                 if t in ("image", "video"):
                     media_type = t
 
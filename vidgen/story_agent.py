@@ -11,15 +11,22 @@ Both agents use Llama-3.1-8B-Instruct via the HF Inference API (free tier).
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Callable
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator
 
 from .config import Config
 from .scriptgen import Scene
 
+if TYPE_CHECKING:
+    from huggingface_hub import AsyncInferenceClient, InferenceClient
+
 log = logging.getLogger(__name__)
 
 REVIEWER_MODEL = "meta-llama/Llama-3.1-8B-Instruct"
@@ -28,12 +35,16 @@ REFINER_MODEL  = "meta-llama/Llama-3.1-8B-Instruct"
 APPROVAL_THRESHOLD = 8   # score >= this → approved
 MAX_REFINE_ITERATIONS = 4
 
+# Reviews are cached in memory by a hash of the full reviewer prompt, so
+# re-reviewing identical scenes within a session never costs another LLM call.
+REVIEW_CACHE_SIZE = 64
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class StoryReview:
     score: int                  # 1–10
     opening_hook: str           # feedback on the first scene
@@ -65,6 +76,17 @@ class StoryReview:
 # Helper — call HF chat completion
 # ---------------------------------------------------------------------------
 
+def _client(token: str) -> "InferenceClient":
+    """Build a client for the synchronous ``review_story`` / ``refine_story``.
+
+    Not cached: the sync client sends every request through huggingface_hub's
+    process-wide HTTP session, so connections are pooled across calls anyway.
+    """
+    from huggingface_hub import InferenceClient
+
+    return InferenceClient(token=token, timeout=60)
+
+
 def _chat(
     system: str,
     user: str,
@@ -72,10 +94,7 @@ def _chat(
     token: str,
     max_tokens: int = 1200,
 ) -> str:
-    from huggingface_hub import InferenceClient
-
-    client = InferenceClient(token=token)
-    resp = client.chat_completion(
+    resp = _client(token).chat_completion(
         messages=[
             {"role": "system", "content": system},
             {"role": "user",   "content": user},
@@ -87,6 +106,108 @@ def _chat(
     return resp.choices[0].message.content.strip()
 
 
+def _aclient(token: str) -> "AsyncInferenceClient":
+    """Create an async client for one event loop's worth of agent calls.
+
+    Unlike the sync client it owns its HTTP session, which is bound to the
+    event loop it was created on.  The caller shares it across calls and
+    closes it.
+    """
+    from huggingface_hub import AsyncInferenceClient
+
+    return AsyncInferenceClient(token=token, timeout=60)
+
+
+async def _achat_stream(
+    client: "AsyncInferenceClient",
+    system: str,
+    user: str,
+    model: str,
+    max_tokens: int = 1200,
+) -> AsyncIterator[str]:
+    """Stream a chat completion, yielding text deltas as they arrive."""
+    stream = await client.chat_completion(
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user",   "content": user},
+        ],
+        model=model,
+        max_tokens=max_tokens,
+        temperature=0.4,
+        stream=True,
+    )
+    async for chunk in stream:
+        if chunk.choices and (delta := chunk.choices[0].delta.content):
+            yield delta
+
+
+async def _achat(
+    system: str,
+    user: str,
+    model: str,
+    token: str,
+    max_tokens: int = 1200,
+    client: "AsyncInferenceClient | None" = None,
+) -> str:
+    """Async counterpart of ``_chat`` used by the review–refine loop.
+
+    The response is streamed, so the 60 s client timeout applies between
+    chunks rather than to the whole (up to 1800-token) generation.  Pass
+    *client* to reuse its connections; otherwise a client is opened and
+    closed for this call.
+    """
+    own_client = client is None
+    if own_client:
+        client = _aclient(token)
+    parts: list[str] = []
+    try:
+        async for delta in _achat_stream(client, system, user, model, max_tokens):
+            parts.append(delta)
+    finally:
+        if own_client:
+            await client.close()
+    return "".join(parts).strip()
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def _iter_json_spans(text: str, open_ch: str = "{", close_ch: str = "}") -> Iterator[str]:
+    """Yield each top-level balanced ``open_ch … close_ch`` span in *text*.
+
+    A single linear scan (no regex backtracking); brackets inside JSON
+    string literals are ignored.
+    """
+    depth = 0
+    start = -1
+    in_str = False
+    escaped = False
+    for i, c in enumerate(text):
+        if in_str:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            # Only strings inside a span matter; quotes in prose are skipped
+            in_str = depth > 0
+        elif c == open_ch:
+            if depth == 0:
+                start = i
+            depth += 1
+        elif c == close_ch and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+
+def _find_json_span(text: str, open_ch: str = "{", close_ch: str = "}") -> str | None:
+    """Return the first balanced ``open_ch … close_ch`` span in *text*."""
+    return next(_iter_json_spans(text, open_ch, close_ch), None)
+
+
 def _extract_json(text: str) -> dict:
     """Extract the first JSON object from a text response."""
     # Try direct parse
@@ -95,17 +216,17 @@ def _extract_json(text: str) -> dict:
     except json.JSONDecodeError:
         pass
     # Find JSON block in markdown code fence
-    fence = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+    fence = _FENCE_RE.search(text)
     if fence:
         try:
             return json.loads(fence.group(1))
         except json.JSONDecodeError:
             pass
     # Find bare JSON object
-    match = re.search(r"\{.*\}", text, re.DOTALL)
-    if match:
+    span = _find_json_span(text)
+    if span:
         try:
-            return json.loads(match.group(0))
+            return json.loads(span)
         except json.JSONDecodeError:
             pass
     raise ValueError(f"No valid JSON found in response:\n{text[:500]}")
@@ -120,13 +241,10 @@ You review short-video storylines (YouTube Shorts / TikTok format, ~2 minutes).
 You give honest, constructive, specific feedback.
 Always respond with ONLY a valid JSON object — no markdown, no extra text."""
 
-_REVIEWER_USER_TEMPLATE = """Review this storyline for a video about: "{prompt}"
-
-SCENES:
-{scenes_text}
-
-Evaluate it on these criteria and respond with exactly this JSON structure:
-{{
+# User prompts are a fixed header followed by the per-request body, so the
+# longest possible prefix of every request is identical (prefix-cache friendly).
+_REVIEWER_USER_HEADER = """Review the storyline below. Evaluate it on these criteria and respond with exactly this JSON structure:
+{
   "score": <integer 1-10>,
   "opening_hook": "<one sentence: is the first scene gripping enough?>",
   "narrative_arc": "<one sentence: does the story have a satisfying arc?>",
@@ -138,36 +256,55 @@ Evaluate it on these criteria and respond with exactly this JSON structure:
     "<specific actionable suggestion 2>",
     "<specific actionable suggestion 3>"
   ]
-}}
+}
 
-Score guide: 1-4 poor, 5-6 average, 7 good, 8 very good, 9 excellent, 10 perfect."""
+Score guide: 1-4 poor, 5-6 average, 7 good, 8 very good, 9 excellent, 10 perfect.
 
+"""
 
-def review_story(
-    scenes: list[Scene],
-    prompt: str,
-    config: Config,
-    progress_cb: Callable[[str], None] | None = None,
-) -> StoryReview:
-    """Ask the reviewer agent to score and critique the storyline."""
-    scenes_text = "\n".join(
+_REVIEWER_USER_TEMPLATE = """Storyline for a video about: "{prompt}"
+
+SCENES:
+{scenes_text}"""
+
+
+def _serialize_scenes_text(scenes: list[Scene]) -> str:
+    """Scene list as the reviewer sees it."""
+    return "\n".join(
         f"Scene {s.index} [{s.media_type}, {s.duration}s]: {s.narration}\n  Visual: {s.visual}"
         for s in scenes
     )
-    user_msg = _REVIEWER_USER_TEMPLATE.format(
+
+
+def _serialize_scenes_json(scenes: list[Scene]) -> str:
+    """Scene list as the refiner sees it."""
+    return json.dumps(
+        [{"index": s.index, "narration": s.narration, "visual": s.visual,
+          "duration": s.duration, "media_type": s.media_type}
+         for s in scenes],
+        indent=2,
+    )
+
+
+def _build_review_prompt(
+    scenes: list[Scene],
+    prompt: str,
+    scenes_text: str | None = None,
+) -> str:
+    if scenes_text is None:
+        scenes_text = _serialize_scenes_text(scenes)
+    return _REVIEWER_USER_HEADER + _REVIEWER_USER_TEMPLATE.format(
         prompt=prompt,
         scenes_text=scenes_text,
     )
 
-    if progress_cb:
-        progress_cb("  🔍 Reviewer agent analysing storyline...")
 
-    raw = _chat(_REVIEWER_SYSTEM, user_msg, REVIEWER_MODEL, config.hf_token)
+def _parse_review(raw: str) -> StoryReview:
     log.debug("Reviewer raw response:\n%s", raw)
 
     data = _extract_json(raw)
 
-    review = StoryReview(
+    return StoryReview(
         score=int(data.get("score", 5)),
         opening_hook=data.get("opening_hook", ""),
         narrative_arc=data.get("narrative_arc", ""),
@@ -177,6 +314,86 @@ def review_story(
         suggestions=data.get("suggestions", []),
         approved=int(data.get("score", 5)) >= APPROVAL_THRESHOLD,
     )
+
+
+_review_cache: OrderedDict[str, StoryReview] = OrderedDict()
+_review_cache_lock = threading.Lock()
+
+
+def _review_key(user_msg: str) -> str:
+    payload = "\n".join((REVIEWER_MODEL, _REVIEWER_SYSTEM, user_msg))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cached_review(key: str) -> StoryReview | None:
+    with _review_cache_lock:
+        review = _review_cache.get(key)
+        if review is not None:
+            _review_cache.move_to_end(key)
+        return review
+
+
+def _store_review(key: str, review: StoryReview) -> None:
+    """Remember *review*, evicting the least recently used past the limit."""
+    with _review_cache_lock:
+        _review_cache[key] = review
+        _review_cache.move_to_end(key)
+        while len(_review_cache) > REVIEW_CACHE_SIZE:
+            _review_cache.popitem(last=False)
+
+
+def review_story(
+    scenes: list[Scene],
+    prompt: str,
+    config: Config,
+    progress_cb: Callable[[str], None] | None = None,
+    scenes_text: str | None = None,
+) -> StoryReview:
+    """Ask the reviewer agent to score and critique the storyline.
+
+    *scenes_text* may carry a precomputed ``_serialize_scenes_text(scenes)``.
+    """
+    user_msg = _build_review_prompt(scenes, prompt, scenes_text)
+    key = _review_key(user_msg)
+    if (cached := _cached_review(key)) is not None:
+        if progress_cb:
+            progress_cb("  🔍 Reviewer: identical storyline already reviewed, reusing score")
+        return cached
+
+    if progress_cb:
+        progress_cb("  🔍 Reviewer agent analysing storyline...")
+
+    raw = _chat(_REVIEWER_SYSTEM, user_msg, REVIEWER_MODEL, config.hf_token)
+    review = _parse_review(raw)
+    _store_review(key, review)
+    return review
+
+
+async def areview_story(
+    scenes: list[Scene],
+    prompt: str,
+    config: Config,
+    progress_cb: Callable[[str], None] | None = None,
+    scenes_text: str | None = None,
+    client: "AsyncInferenceClient | None" = None,
+) -> StoryReview:
+    """Async variant of ``review_story``."""
+    user_msg = _build_review_prompt(scenes, prompt, scenes_text)
+    key = _review_key(user_msg)
+    if (cached := _cached_review(key)) is not None:
+        if progress_cb:
+            progress_cb("  🔍 Reviewer: identical storyline already reviewed, reusing score")
+        return cached
+
+    if progress_cb:
+        progress_cb("  🔍 Reviewer agent analysing storyline...")
+
+    raw = await _achat(
+        _REVIEWER_SYSTEM, user_msg, REVIEWER_MODEL, config.hf_token,
+        client=client,
+    )
+    review = _parse_review(raw)
+    _store_review(key, review)
     return review
 
 
@@ -188,9 +405,27 @@ _REFINER_SYSTEM = """You are an expert screenwriter and video content creator.
 You rewrite short-video storylines to make them more compelling, emotional, and cinematic.
 Always respond with ONLY a valid JSON array of scenes — no markdown, no extra text."""
 
-_REFINER_USER_TEMPLATE = """Rewrite this storyline for a video about: "{prompt}"
+_REFINER_USER_HEADER = """Rewrite the storyline below to address the reviewer's feedback.
+
+RULES:
+- Keep exactly the same number of scenes, in the same order
+- Keep the same media_type and duration for each scene (do NOT change them)
+- Improve narration to be more evocative and emotionally resonant
+- Improve visual descriptions to be more cinematic and specific
+- Maintain the narrative arc of the video's topic
+- Each narration should be 1-2 short punchy sentences (max 15 words)
+
+Respond with ONLY a JSON array:
+[
+  {"index": 0, "narration": "...", "visual": "...", "duration": <number>, "media_type": "..."},
+  ...
+]
+
+"""
+
+_REFINER_USER_TEMPLATE = """Video topic: "{prompt}"
 
-CURRENT SCENES (JSON):
+CURRENT SCENES (JSON, {n_scenes} scenes — return exactly {n_scenes}):
 {scenes_json}
 
 REVIEWER FEEDBACK (score {score}/10):
@@ -201,40 +436,20 @@ REVIEWER FEEDBACK (score {score}/10):
 - Pacing          : {pacing}
 
 SUGGESTIONS TO ADDRESS:
-{suggestions_text}
+{suggestions_text}"""
 
-RULES:
-- Keep exactly {n_scenes} scenes in the same order
-- Keep the same media_type and duration for each scene (do NOT change them)
-- Improve narration to be more evocative and emotionally resonant
-- Improve visual descriptions to be more cinematic and specific
-- Maintain the narrative arc about: {prompt}
-- Each narration should be 1-2 short punchy sentences (max 15 words)
-
-Respond with ONLY a JSON array:
-[
-  {{"index": 0, "narration": "...", "visual": "...", "duration": <number>, "media_type": "..."}},
-  ...
-]"""
 
-
-def refine_story(
+def _build_refine_prompt(
     scenes: list[Scene],
     review: StoryReview,
     prompt: str,
-    config: Config,
-    progress_cb: Callable[[str], None] | None = None,
-) -> list[Scene]:
-    """Ask the refiner agent to rewrite the story based on review feedback."""
-    scenes_json = json.dumps(
-        [{"index": s.index, "narration": s.narration, "visual": s.visual,
-          "duration": s.duration, "media_type": s.media_type}
-         for s in scenes],
-        indent=2,
-    )
+    scenes_json: str | None = None,
+) -> str:
+    if scenes_json is None:
+        scenes_json = _serialize_scenes_json(scenes)
     suggestions_text = "\n".join(f"  • {s}" for s in review.suggestions) or "  • Improve overall quality"
 
-    user_msg = _REFINER_USER_TEMPLATE.format(
+    return _REFINER_USER_HEADER + _REFINER_USER_TEMPLATE.format(
         prompt=prompt,
         scenes_json=scenes_json,
         score=review.score,
@@ -247,81 +462,192 @@ def refine_story(
         n_scenes=len(scenes),
     )
 
-    if progress_cb:
-        progress_cb("  ✍️  Refiner agent rewriting storyline...")
 
-    raw = _chat(_REFINER_SYSTEM, user_msg, REFINER_MODEL, config.hf_token, max_tokens=1800)
+def _is_scene_item(obj: object) -> bool:
+    """True for a dict that looks like a refined scene, not a wrapper."""
+    return isinstance(obj, dict) and ("narration" in obj or "visual" in obj)
+
+
+def _parse_refined(raw: str, scenes: list[Scene]) -> list[Scene]:
+    """Turn the refiner's raw response into scenes, or return *scenes* unchanged.
+
+    A malformed response is salvaged object by object: every scene that
+    parses is used, and the original scene fills any gap.
+    """
     log.debug("Refiner raw response:\n%s", raw)
 
     # Extract JSON array
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
+        data = None
         # Try to find JSON array in response
-        arr_match = re.search(r"\[.*\]", raw, re.DOTALL)
-        if arr_match:
+        arr_span = _find_json_span(raw, "[", "]")
+        if arr_span:
             try:
-                data = json.loads(arr_match.group(0))
+                data = json.loads(arr_span)
             except json.JSONDecodeError:
-                log.warning("Refiner JSON parse failed, keeping original scenes")
-                return scenes
-        else:
-            log.warning("No JSON array in refiner response, keeping original scenes")
-            return scenes
-
-    if not isinstance(data, list) or len(data) == 0:
-        log.warning("Refiner returned empty/invalid list, keeping original scenes")
+                pass
+
+    if isinstance(data, dict) and isinstance(data.get("scenes"), list):
+        data = data["scenes"]  # {"scenes": [...]} wrapper
+
+    if isinstance(data, list):
+        items = [item for item in data if _is_scene_item(item)]
+    else:
+        # Trailing chatter or a truncated last object: keep whatever scene
+        # objects are individually valid
+        items = []
+        for span in _iter_json_spans(raw):
+            try:
+                obj = json.loads(span)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict) and isinstance(obj.get("scenes"), list):
+                items.extend(item for item in obj["scenes"] if _is_scene_item(item))
+            elif _is_scene_item(obj):
+                items.append(obj)
+        if items:
+            log.warning("Refiner JSON malformed, salvaged %d scene object(s)", len(items))
+
+    if len(items) > len(scenes):
+        log.warning("Refiner returned %d scenes for %d, ignoring the extras",
+                    len(items), len(scenes))
+
+    # Match items to original scenes by index (position if it's missing)
+    original_by_index = {s.index: s for s in scenes}
+    updates: dict[int, dict] = {}
+    for pos, item in enumerate(items):
+        try:
+            idx = int(item.get("index", scenes[pos].index if pos < len(scenes) else -1))
+        except (TypeError, ValueError):
+            continue
+        if idx in original_by_index:
+            updates.setdefault(idx, item)
+
+    if not updates:
+        log.warning("No usable scenes in refiner response, keeping original scenes")
         return scenes
+    if len(updates) < len(scenes):
+        log.warning("Refiner returned %d/%d scenes, keeping originals for the rest",
+                    len(updates), len(scenes))
 
-    # Rebuild Scene objects, preserving original media_type/duration if missing
+    # Rebuild Scene objects, preserving original fields if missing
     refined: list[Scene] = []
-    original_by_index = {s.index: s for s in scenes}
-
-    for item in data:
-        idx = int(item.get("index", len(refined)))
-        orig = original_by_index.get(idx)
+    for orig in scenes:
+        item = updates.get(orig.index)
+        if item is None:
+            refined.append(orig)
+            continue
+        try:
+            duration = float(item.get("duration", orig.duration))
+        except (TypeError, ValueError):
+            log.warning("Scene %d: bad duration %r from refiner, keeping %.1fs",
+                        orig.index, item.get("duration"), orig.duration)
+            duration = orig.duration
         refined.append(Scene(
-            index=idx,
-            narration=item.get("narration", orig.narration if orig else ""),
-            visual=item.get("visual", orig.visual if orig else ""),
-            duration=float(item.get("duration", orig.duration if orig else 10.0)),
-            media_type=item.get("media_type", orig.media_type if orig else "image"),
+            index=orig.index,
+            narration=item.get("narration", orig.narration),
+            visual=item.get("visual", orig.visual),
+            duration=duration,
+            media_type=item.get("media_type", orig.media_type),
         ))
 
-    # Ensure we have same number of scenes as original
-    if len(refined) != len(scenes):
-        log.warning("Refiner changed scene count (%d→%d), keeping original", len(scenes), len(refined))
-        return scenes
-
     return refined
 
 
+def refine_story(
+    scenes: list[Scene],
+    review: StoryReview,
+    prompt: str,
+    config: Config,
+    progress_cb: Callable[[str], None] | None = None,
+    scenes_json: str | None = None,
+) -> list[Scene]:
+    """Ask the refiner agent to rewrite the story based on review feedback.
+
+    *scenes_json* may carry a precomputed ``_serialize_scenes_json(scenes)``.
+    """
+    user_msg = _build_refine_prompt(scenes, review, prompt, scenes_json)
+
+    if progress_cb:
+        progress_cb("  ✍️  Refiner agent rewriting storyline...")
+
+    raw = _chat(_REFINER_SYSTEM, user_msg, REFINER_MODEL, config.hf_token, max_tokens=1800)
+    return _parse_refined(raw, scenes)
+
+
+async def arefine_story(
+    scenes: list[Scene],
+    review: StoryReview,
+    prompt: str,
+    config: Config,
+    progress_cb: Callable[[str], None] | None = None,
+    scenes_json: str | None = None,
+    client: "AsyncInferenceClient | None" = None,
+) -> list[Scene]:
+    """Async variant of ``refine_story``."""
+    user_msg = _build_refine_prompt(scenes, review, prompt, scenes_json)
+
+    if progress_cb:
+        progress_cb("  ✍️  Refiner agent rewriting storyline...")
+
+    raw = await _achat(
+        _REFINER_SYSTEM, user_msg, REFINER_MODEL, config.hf_token,
+        max_tokens=1800, client=client,
+    )
+    return _parse_refined(raw, scenes)
+
+
 # ---------------------------------------------------------------------------
 # Main review–refine loop
 # ---------------------------------------------------------------------------
 
-def review_and_refine(
+async def _review_refine_loop(
     scenes: list[Scene],
     prompt: str,
     config: Config,
-    progress_cb: Callable[[str], None] | None = None,
-    max_iterations: int = MAX_REFINE_ITERATIONS,
-) -> tuple[list[Scene], StoryReview]:
-    """Run the reviewer–refiner loop until approved or max iterations reached.
+    cb: Callable[[str], None],
+    max_iterations: int,
+) -> tuple[list[Scene], StoryReview | None]:
+    # One client per run: every review and refine call shares its connections
+    client = _aclient(config.hf_token)
+    try:
+        return await _review_refine_iterations(
+            scenes, prompt, config, cb, max_iterations, client,
+        )
+    finally:
+        await client.close()
 
-    Returns the best scenes found and the final review.
-    """
-    cb = progress_cb or (lambda msg: None)
 
+async def _review_refine_iterations(
+    scenes: list[Scene],
+    prompt: str,
+    config: Config,
+    cb: Callable[[str], None],
+    max_iterations: int,
+    client: "AsyncInferenceClient",
+) -> tuple[list[Scene], StoryReview | None]:
     best_scenes = scenes
     best_review: StoryReview | None = None
+    serialized: list[Scene] | None = None
 
     for iteration in range(1, max_iterations + 1):
         cb(f"\n  --- Iteration {iteration}/{max_iterations} ---")
 
+        # Serialise once per distinct scene list; a refiner that fell back to
+        # the previous scenes hands back the same list object.
+        if best_scenes is not serialized:
+            scenes_text = _serialize_scenes_text(best_scenes)
+            scenes_json = _serialize_scenes_json(best_scenes)
+            serialized = best_scenes
+
         # Reviewer
         try:
-            review = review_story(best_scenes, prompt, config, cb)
+            review = await areview_story(
+                best_scenes, prompt, config, cb,
+                scenes_text=scenes_text, client=client,
+            )
         except Exception as e:
             cb(f"  ⚠ Reviewer failed: {e} — stopping review loop")
             log.warning("Reviewer failed: %s", e)
@@ -335,7 +661,6 @@ def review_and_refine(
 
         if review.approved:
             cb(f"\n  ✅ Story approved with score {review.score}/10!")
-            best_scenes = best_scenes  # already best
             break
 
         if iteration == max_iterations:
@@ -344,13 +669,35 @@ def review_and_refine(
 
         # Refiner
         try:
-            refined = refine_story(best_scenes, review, prompt, config, cb)
-            best_scenes = refined
+            best_scenes = await arefine_story(
+                best_scenes, review, prompt, config, cb,
+                scenes_json=scenes_json, client=client,
+            )
         except Exception as e:
             cb(f"  ⚠ Refiner failed: {e} — stopping refinement")
             log.warning("Refiner failed: %s", e)
             break
 
+    return best_scenes, best_review
+
+
+def review_and_refine(
+    scenes: list[Scene],
+    prompt: str,
+    config: Config,
+    progress_cb: Callable[[str], None] | None = None,
+    max_iterations: int = MAX_REFINE_ITERATIONS,
+) -> tuple[list[Scene], StoryReview]:
+    """Run the reviewer–refiner loop until approved or max iterations reached.
+
+    Returns the best scenes found and the final review.
+    """
+    cb = progress_cb or (lambda msg: None)
+
+    best_scenes, best_review = asyncio.run(
+        _review_refine_loop(scenes, prompt, config, cb, max_iterations)
+    )
+
     return best_scenes, best_review or StoryReview(
         score=0, opening_hook="", narrative_arc="", emotional_journey="",
         visual_quality="", pacing="", suggestions=[], approved=False,
@@ -3,17 +3,27 @@
 Generates per-scene narration audio using natural, high-quality neural voices,
 times each clip to its scene duration, then assembles a single narrator track
 that matches the full video timeline.
+
+Speech MP3s are cached in a per-session temp directory, keyed by text and
+voice settings, so duration sync and track assembly share one copy.  The
+directory is removed when the process exits.
 """
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-import shutil
+import os
 import subprocess
 import tempfile
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable
 
+import numpy as np
+
 from .config import NARRATION_LEAD_IN, NARRATION_PADDING_AFTER
 from .scriptgen import Scene
 
@@ -24,6 +34,16 @@ log = logging.getLogger(__name__)
 EDGE_TTS_VOICE = "en-US-GuyNeural"
 EDGE_TTS_RATE  = "-8%"    # slightly slower for gravitas
 EDGE_TTS_PITCH = "-5Hz"   # slightly lower pitch for depth
+EDGE_TTS_CONCURRENCY = 4  # simultaneous Edge TTS requests per batch
+
+_tts_cache: tempfile.TemporaryDirectory | None = None
+_tts_cache_lock = threading.Lock()
+
+SAMPLE_RATE = 44100  # narration track: 16-bit mono PCM
+
+# Worker threads for per-scene ffprobe/ffmpeg calls; each one just waits on
+# its own subprocess, so the GIL is not a bottleneck.
+AUDIO_WORKERS = 8
 
 
 async def _edge_tts_to_mp3_async(
@@ -50,6 +70,94 @@ def _edge_tts_to_mp3(
     asyncio.run(_edge_tts_to_mp3_async(text, output_path, voice, rate, pitch))
 
 
+async def _edge_tts_batch_async(
+    texts: list[str],
+    output_paths: list[Path],
+    voice: str,
+    rate: str,
+    pitch: str,
+) -> list[BaseException | None]:
+    sem = asyncio.Semaphore(EDGE_TTS_CONCURRENCY)
+
+    async def _one(text: str, path: Path) -> None:
+        async with sem:
+            await _edge_tts_to_mp3_async(text, path, voice, rate, pitch)
+
+    return await asyncio.gather(
+        *(_one(t, p) for t, p in zip(texts, output_paths)),
+        return_exceptions=True,
+    )
+
+
+def _edge_tts_batch(
+    texts: list[str],
+    output_paths: list[Path],
+    voice: str = EDGE_TTS_VOICE,
+    rate: str = EDGE_TTS_RATE,
+    pitch: str = EDGE_TTS_PITCH,
+) -> list[BaseException | None]:
+    """Generate one MP3 per text in a single event loop, several at a time.
+
+    Returns a list aligned with *texts*: ``None`` on success, otherwise the
+    exception raised for that item.
+    """
+    return asyncio.run(_edge_tts_batch_async(texts, output_paths, voice, rate, pitch))
+
+
+def _tts_cache_dir() -> Path:
+    """Session-scoped MP3 cache; TemporaryDirectory deletes it at exit."""
+    global _tts_cache
+    with _tts_cache_lock:
+        if _tts_cache is None:
+            _tts_cache = tempfile.TemporaryDirectory(prefix="vidgen-tts-")
+        return Path(_tts_cache.name)
+
+
+def _tts_cache_path(text: str, voice: str, rate: str, pitch: str) -> Path:
+    key = hashlib.sha1("\0".join((text, voice, rate, pitch)).encode("utf-8")).hexdigest()
+    return _tts_cache_dir() / f"{key}.mp3"
+
+
+def _narration_mp3s(
+    texts: list[str],
+    voice: str = EDGE_TTS_VOICE,
+    rate: str = EDGE_TTS_RATE,
+    pitch: str = EDGE_TTS_PITCH,
+) -> tuple[list[Path], list[BaseException | None]]:
+    """Return the cached MP3 for each text, synthesising any that are missing.
+
+    The second list is aligned with *texts*: ``None`` when the MP3 is
+    available, otherwise the TTS error for that text.
+    """
+    paths = [_tts_cache_path(t, voice, rate, pitch) for t in texts]
+    missing = list(dict.fromkeys(p for p in paths if not p.exists()))
+    failed: dict[Path, BaseException] = {}
+
+    if missing:
+        cache_dir = _tts_cache_dir()
+        text_for = dict(zip(paths, texts))
+        # Write to temp names first so an interrupted download never leaves a
+        # truncated MP3 behind under its final cache key.
+        part_paths: list[Path] = []
+        for _ in missing:
+            fd, part = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+            os.close(fd)
+            part_paths.append(Path(part))
+
+        errors = _edge_tts_batch(
+            [text_for[p] for p in missing], part_paths,
+            voice=voice, rate=rate, pitch=pitch,
+        )
+        for path, part, err in zip(missing, part_paths, errors):
+            if err is None:
+                os.replace(part, path)
+            else:
+                failed[path] = err
+                part.unlink(missing_ok=True)
+
+    return paths, [failed.get(p) for p in paths]
+
+
 def _mp3_duration(mp3_path: Path) -> float:
     """Get duration of an MP3 using ffprobe."""
     cmd = [
@@ -86,14 +194,28 @@ def sync_scene_durations_to_narration(
     if progress_cb:
         progress_cb("🎙️  Syncing scene durations to narration timing...")
 
-    tmpdir = Path(tempfile.mkdtemp(prefix="vidgen_tts_sync_"))
+    mp3_paths, errors = _narration_mp3s(
+        [scene.narration for scene in scenes],
+        voice=voice, rate=rate, pitch=pitch,
+    )
 
-    for scene in scenes:
+    def _probe(i: int) -> float:
+        if errors[i] is None:
+            try:
+                return _mp3_duration(mp3_paths[i])
+            except Exception as e:
+                errors[i] = e
+        return 0.0
+
+    # Probe all clips in parallel; failures are reported per scene below
+    with ThreadPoolExecutor(max_workers=AUDIO_WORKERS) as pool:
+        speech_durs = list(pool.map(_probe, range(len(scenes))))
+
+    for scene, err, speech_dur in zip(scenes, errors, speech_durs):
         try:
-            mp3_path = tmpdir / f"sync_{scene.index:03d}.mp3"
-            _edge_tts_to_mp3(scene.narration, mp3_path, voice=voice, rate=rate, pitch=pitch)
+            if err is not None:
+                raise err
 
-            speech_dur = _mp3_duration(mp3_path)
             required_dur = NARRATION_LEAD_IN + speech_dur + NARRATION_PADDING_AFTER
 
             if scene.duration < required_dur:
@@ -115,8 +237,6 @@ def sync_scene_durations_to_narration(
             if progress_cb:
                 progress_cb(f"  Scene {scene.index}: sync failed ({e}), keeping {scene.duration}s")
 
-    shutil.rmtree(tmpdir, ignore_errors=True)
-
     total_dur = sum(s.duration for s in scenes)
     if progress_cb:
         progress_cb(f"  ✓ Total duration after sync: {total_dur:.0f}s")
@@ -124,57 +244,56 @@ def sync_scene_durations_to_narration(
     return scenes
 
 
-def _make_scene_audio(
+def _write_wav(output_wav: Path, samples: np.ndarray) -> Path:
+    """Write int16 mono samples as a PCM WAV at SAMPLE_RATE."""
+    output_wav.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(output_wav), "w") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)   # 16-bit PCM
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(samples.astype(np.int16, copy=False).tobytes())
+    return output_wav
+
+
+def _decode_mp3(mp3_path: Path) -> np.ndarray:
+    """Decode an MP3 to int16 mono samples at SAMPLE_RATE via an ffmpeg pipe."""
+    cmd = [
+        "ffmpeg", "-v", "error",
+        "-i", str(mp3_path),
+        "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1",
+        "pipe:1",
+    ]
+    result = subprocess.run(cmd, capture_output=True, timeout=60)
+    if result.returncode != 0:
+        raise RuntimeError(f"decode failed: {result.stderr.decode(errors='replace')[-300:]}")
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+
+def _scene_samples(
     narration_mp3: Path,
     scene_duration: float,
-    output_wav: Path,
     lead_in: float = NARRATION_LEAD_IN,
-) -> Path:
-    """Produce a WAV clip exactly scene_duration seconds long.
+) -> np.ndarray:
+    """Return int16 samples exactly scene_duration seconds long.
 
     Structure: lead_in silence | narration | silence padding to fill scene.
-    If narration is longer than the scene, trim it.
+    If narration is longer than the scene, trim it.  The speech is decoded
+    once and the silences are plain zero samples, so no ffprobe call or
+    ffmpeg filter graph is needed.
     """
-    speech_dur = _mp3_duration(narration_mp3)
-    available = max(0.0, scene_duration - lead_in)
-    trim_dur = min(speech_dur, available)
-    silence_after = max(0.0, scene_duration - lead_in - trim_dur)
-
-    filter_complex = (
-        f"[0:a]atrim=0:{trim_dur},asetpts=PTS-STARTPTS[speech];"
-        f"aevalsrc=0:d={lead_in}[silence_before];"
-        f"aevalsrc=0:d={silence_after}[silence_after];"
-        f"[silence_before][speech][silence_after]concat=n=3:v=0:a=1[out]"
-    )
+    speech = _decode_mp3(narration_mp3)
 
-    output_wav.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(narration_mp3),
-        "-filter_complex", filter_complex,
-        "-map", "[out]",
-        "-ar", "44100", "-ac", "1",
-        "-t", str(scene_duration),
-        str(output_wav),
-    ]
-    result = subprocess.run(cmd, capture_output=True, timeout=60)
-    if result.returncode != 0:
-        log.warning("scene audio build failed: %s", result.stderr.decode(errors="replace")[-300:])
-        _make_silence(output_wav, scene_duration)
-    return output_wav
+    total = int(round(scene_duration * SAMPLE_RATE))
+    start = min(int(round(lead_in * SAMPLE_RATE)), total)
+    speech = speech[:total - start]
 
+    samples = np.zeros(total, dtype=np.int16)
+    samples[start:start + len(speech)] = speech
+    return samples
 
-def _make_silence(output_wav: Path, duration: float) -> Path:
-    """Generate a silent WAV of given duration."""
-    output_wav.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
-        "-t", str(duration),
-        str(output_wav),
-    ]
-    subprocess.run(cmd, capture_output=True, check=True, timeout=15)
-    return output_wav
+
+def _silence(duration: float) -> np.ndarray:
+    return np.zeros(int(round(duration * SAMPLE_RATE)), dtype=np.int16)
 
 
 def generate_narration_track(
@@ -186,60 +305,45 @@ def generate_narration_track(
     rate: str = EDGE_TTS_RATE,
     pitch: str = EDGE_TTS_PITCH,
 ) -> Path:
-    """Generate a complete narrator audio track for the whole video.
+    """Generate a complete narrator audio track (16-bit mono WAV) for the whole video.
 
     Each scene's narration is spoken at the right time offset, padded with
     silence to fill the scene duration, then all scenes are concatenated.
     """
     assert len(scene_narrations) == len(scene_durations), "mismatch"
 
-    tmpdir = Path(tempfile.mkdtemp(prefix="vidgen_tts_"))
-    scene_wavs: list[Path] = []
-
-    for i, (text, dur) in enumerate(zip(scene_narrations, scene_durations)):
-        if progress_cb:
-            progress_cb(f"  Narrating scene {i}: \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
+    # Normally all cache hits: sync_scene_durations_to_narration already
+    # synthesised these exact texts with the same voice settings.
+    mp3_paths, errors = _narration_mp3s(scene_narrations, voice=voice, rate=rate, pitch=pitch)
 
+    def _scene_audio(i: int) -> np.ndarray:
+        dur = scene_durations[i]
         try:
-            mp3_path = tmpdir / f"speech_{i:03d}.mp3"
-            _edge_tts_to_mp3(text, mp3_path, voice=voice, rate=rate, pitch=pitch)
-
-            wav_path = tmpdir / f"scene_{i:03d}.wav"
-            _make_scene_audio(mp3_path, dur, wav_path)
-            scene_wavs.append(wav_path)
-
+            if errors[i] is not None:
+                raise errors[i]
+            return _scene_samples(mp3_paths[i], dur)
         except Exception as e:
             log.warning("TTS failed for scene %d: %s — using silence", i, e)
             if progress_cb:
                 progress_cb(f"  ⚠ TTS scene {i} failed: {e}")
-            silence_wav = tmpdir / f"scene_{i:03d}.wav"
-            _make_silence(silence_wav, dur)
-            scene_wavs.append(silence_wav)
+            return _silence(dur)
 
-    if not scene_wavs:
+    if progress_cb:
+        for i, text in enumerate(scene_narrations):
+            progress_cb(f"  Narrating scene {i}: \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
+
+    # Scene clips stay in memory and are written out as one WAV: no
+    # per-scene temp files and no ffmpeg concat pass.
+    with ThreadPoolExecutor(max_workers=AUDIO_WORKERS) as pool:
+        scene_audio = list(pool.map(_scene_audio, range(len(scene_narrations))))
+
+    if not scene_audio:
         raise RuntimeError("No narration clips generated.")
 
     if progress_cb:
         progress_cb("  Assembling full narration timeline...")
 
-    list_file = tmpdir / "narration_list.txt"
-    with open(list_file, "w") as f:
-        for wav in scene_wavs:
-            f.write(f"file '{wav}'\n")
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        "ffmpeg", "-y",
-        "-f", "concat", "-safe", "0",
-        "-i", str(list_file),
-        "-ar", "44100", "-ac", "1",
-        str(output_path),
-    ]
-    result = subprocess.run(cmd, capture_output=True, timeout=300)
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"Narration concat failed: {result.stderr.decode(errors='replace')[-300:]}"
-        )
+    _write_wav(output_path, np.concatenate(scene_audio))
 
     if progress_cb:
         size_kb = output_path.stat().st_size // 1024
@@ -3,14 +3,20 @@ from __future__ import annotations
 
 import re
 import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial, wraps
 from pathlib import Path
 
+from rich.markup import MarkupError
+from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.widgets import (
     Button,
+    ContentSwitcher,
     Footer,
     Header,
     Input,
@@ -24,10 +30,21 @@ from textual.widgets import (
 from .config import Config
 from .pipeline import Pipeline, PipelineCancelled
 from .scriptgen import StorySettings, parse_markdown_story, parse_user_story
-from .batchutil import resolve_md_paths as _resolve_md_paths
+from .batchutil import resolve_md_paths
 
-# Regex to detect stage-header lines like "📝 Stage 1/5: ..."
-_STAGE_RE = re.compile(r"Stage\s+(\d+(?:\.\d+)?)/5[:\s]+(.*)", re.IGNORECASE)
+
+# All keyword checks of _rich_format in one alternation, so a message is
+# scanned once.  Precedence between groups is applied in _rich_format.
+# The "stage" group detects stage-header lines like "📝 Stage 1/5: ...".
+_STYLE_RE = re.compile(
+    r"(?P<stage>(?i:Stage\s+\d+(?:\.\d+)?/5[:\s]))"
+    r"|(?P<done>✅|🎉|approved|Done!)"
+    r"|(?P<warn>⚠|⛔|✗|failed|skipping)"
+    r"|(?P<agent>🔍|✍|Reviewer|Refiner|Iteration)"
+)
+
+# How often queued log lines are flushed to the RichLog (seconds)
+_LOG_FLUSH_INTERVAL = 0.05
 
 # Input mode constants
 _MODE_AUTO   = "auto"
@@ -48,23 +65,55 @@ If you dare to dream it — you can fly. | Man silhouetted against blazing sunse
 """
 
 
-def _rich_format(msg: str) -> str:
-    """Apply Rich markup to key pipeline messages for better readability."""
-    if _STAGE_RE.search(msg):
-        return f"[bold cyan]{msg}[/bold cyan]"
-    if any(x in msg for x in ("✅", "🎉", "approved", "Done!")):
-        return f"[bold green]{msg}[/bold green]"
-    if any(x in msg for x in ("⚠", "⛔", "✗", "failed", "skipping")):
-        return f"[yellow]{msg}[/yellow]"
-    if msg.strip().startswith("✓"):
-        return f"[green]{msg}[/green]"
-    if msg.strip().startswith("Score:"):
-        return f"[bold magenta]{msg}[/bold magenta]"
-    if any(x in msg for x in ("🔍", "✍", "Reviewer", "Refiner", "Iteration")):
-        return f"[dim cyan]{msg}[/dim cyan]"
-    if msg.strip().startswith("📖 Using") or msg.strip().startswith("📄"):
-        return f"[bold blue]{msg}[/bold blue]"
-    return msg
+def _ui(fn):
+    """Run an App method on the UI thread, hopping over from workers if needed."""
+
+    @wraps(fn)
+    def wrapper(self, *args):
+        if threading.get_ident() == self._thread_id:
+            return fn(self, *args)
+        return self.call_from_thread(fn, self, *args)
+
+    return wrapper
+
+
+@lru_cache(maxsize=2048)
+def _rich_format(msg: str) -> tuple[str, bool]:
+    """Apply Rich markup to key pipeline messages for better readability.
+
+    Returns ``(formatted, is_stage)`` so callers can react to stage headers
+    without matching the message again.  Memoised: stage headers, bullets
+    and status lines repeat across scenes and runs.
+    """
+    found = {m.lastgroup for m in _STYLE_RE.finditer(msg)}
+    head = msg.lstrip()  # only the leading whitespace matters to startswith
+    if "stage" in found:
+        return f"[bold cyan]{msg}[/bold cyan]", True
+    if "done" in found:
+        return f"[bold green]{msg}[/bold green]", False
+    if "warn" in found:
+        return f"[yellow]{msg}[/yellow]", False
+    if head.startswith("✓"):
+        return f"[green]{msg}[/green]", False
+    if head.startswith("Score:"):
+        return f"[bold magenta]{msg}[/bold magenta]", False
+    if "agent" in found:
+        return f"[dim cyan]{msg}[/dim cyan]", False
+    if head.startswith(("📖 Using", "📄")):
+        return f"[bold blue]{msg}[/bold blue]", False
+    return msg, False
+
+
+def _markup_text(markup: str, plain: str | None = None) -> Text:
+    """Parse *markup* into a log line.
+
+    A message whose own brackets read as bad markup (e.g. ``[/v1]`` in a
+    URL) is shown unstyled as *plain* (default: *markup*) instead of raising.
+    """
+    try:
+        return Text.from_markup(markup)
+    except MarkupError:
+        return Text(markup if plain is None else plain)
 
 
 class VidGenApp(App):
@@ -98,6 +147,10 @@ class VidGenApp(App):
         width: 46;
     }
 
+    #mode-switcher {
+        height: auto;
+    }
+
     /* Auto-prompt section */
     #auto-section {
         height: auto;
@@ -193,11 +246,19 @@ class VidGenApp(App):
     def __init__(self) -> None:
         super().__init__()
         self._config = Config.load()
-        self._pipeline: Pipeline | None = None
+        self._has_hf = bool(self._config.hf_token)
+        # Every pipeline currently running, so cancel reaches all of them
+        self._pipelines: set[Pipeline] = set()
+        self._pipelines_lock = threading.Lock()
         self._running = False
         self._thread_id = threading.get_ident()
         self._mode = _MODE_AUTO
         self._cancel_requested = threading.Event()
+        # Log lines and the latest status from worker threads, drained by
+        # _flush_logs on a timer so chatty stages can't flood the event loop
+        self._log_queue: deque[Text] = deque()
+        self._log_lock = threading.Lock()
+        self._pending_status: str | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -218,58 +279,60 @@ class VidGenApp(App):
                 )
 
             # HF token warning
-            if not self._config.hf_token:
+            if not self._has_hf:
                 yield Static(
                     "⚠  No HF_TOKEN found — AI image/review stages will use placeholders. "
                     "Set HF_TOKEN env var or add it to ~/.vidgen/config.json",
                     classes="placeholder-warning",
                 )
 
-            # --- Auto mode section ---
-            with Vertical(id="auto-section"):
-                yield Label(
-                    "Enter any video idea — the pipeline will write, review, illustrate, "
-                    "narrate and score it automatically:",
-                    id="auto-hint",
-                )
-                yield Input(
-                    placeholder="e.g., A man who learns to fly with giant mechanical wings",
-                    id="prompt-input",
-                )
+            # One section per mode; only the current one is displayed
+            with ContentSwitcher(initial="auto-section", id="mode-switcher"):
+                # --- Auto mode section ---
+                with Vertical(id="auto-section"):
+                    yield Label(
+                        "Enter any video idea — the pipeline will write, review, illustrate, "
+                        "narrate and score it automatically:",
+                        id="auto-hint",
+                    )
+                    yield Input(
+                        placeholder="e.g., A man who learns to fly with giant mechanical wings",
+                        id="prompt-input",
+                    )
 
-            # --- Manual mode section (hidden by default) ---
-            with Vertical(id="manual-section"):
-                yield Label(
-                    "Enter your story below — one scene per line:\n"
-                    "  [bold]narration | visual description[/bold]  "
-                    "[ | seconds ]  [ | image / video ]\n"
-                    "Lines starting with # are ignored.  "
-                    "See [bold]assets/story_template.md[/bold] for the markdown format.",
-                    id="manual-hint",
-                    markup=True,
-                )
-                yield TextArea(
-                    _STORY_PLACEHOLDER,
-                    id="story-input",
-                    tab_behavior="indent",
-                )
+                # --- Manual mode section ---
+                with Vertical(id="manual-section"):
+                    yield Label(
+                        "Enter your story below — one scene per line:\n"
+                        "  [bold]narration | visual description[/bold]  "
+                        "[ | seconds ]  [ | image / video ]\n"
+                        "Lines starting with # are ignored.  "
+                        "See [bold]assets/story_template.md[/bold] for the markdown format.",
+                        id="manual-hint",
+                        markup=True,
+                    )
+                    yield TextArea(
+                        _STORY_PLACEHOLDER,
+                        id="story-input",
+                        tab_behavior="indent",
+                    )
 
-            # --- Markdown files section (hidden by default) ---
-            with Vertical(id="files-section"):
-                yield Label(
-                    "Enter a path to a [bold].md[/bold] story file, directory, or [bold]glob pattern[/bold].\n"
-                    "  • Single file:  ~/stories/my_story.md\n"
-                    "  • Directory:   ~/stories/ (processes all [bold].md[/bold] files)\n"
-                    "  • Glob pattern: ~/stories/zodiac*.md\n"
-                    "  • Multiple:    path1.md,path2.md (comma-separated)\n\n"
-                    "See [bold]assets/story_template.md[/bold] for the expected format.",
-                    id="files-hint",
-                    markup=True,
-                )
-                yield Input(
-                    placeholder="e.g., ~/stories/flying_man.md  or  ~/stories/",
-                    id="files-path-input",
-                )
+                # --- Markdown files section ---
+                with Vertical(id="files-section"):
+                    yield Label(
+                        "Enter a path to a [bold].md[/bold] story file, directory, or [bold]glob pattern[/bold].\n"
+                        "  • Single file:  ~/stories/my_story.md\n"
+                        "  • Directory:   ~/stories/ (processes all [bold].md[/bold] files)\n"
+                        "  • Glob pattern: ~/stories/zodiac*.md\n"
+                        "  • Multiple:    path1.md,path2.md (comma-separated)\n\n"
+                        "See [bold]assets/story_template.md[/bold] for the expected format.",
+                        id="files-hint",
+                        markup=True,
+                    )
+                    yield Input(
+                        placeholder="e.g., ~/stories/flying_man.md  or  ~/stories/",
+                        id="files-path-input",
+                    )
 
         with Horizontal(id="button-bar"):
             yield Button("🚀 Generate",              id="btn-generate", variant="primary")
@@ -277,7 +340,7 @@ class VidGenApp(App):
             yield Button("🧪 Test (placeholders)",   id="btn-test",     variant="warning")
             yield Button("🗑  Clear log",             id="btn-clear",    variant="default")
 
-        yield RichLog(id="log-area", highlight=True, markup=True, wrap=True)
+        yield RichLog(id="log-area", highlight=False, markup=True, wrap=True)
         yield Static(
             "Ready. Choose a mode, enter your idea, then press 🚀 Generate.",
             id="status-bar",
@@ -289,9 +352,16 @@ class VidGenApp(App):
     # ------------------------------------------------------------------
 
     def on_mount(self) -> None:
-        """Hide non-default sections after the widget tree is fully mounted."""
-        self.query_one("#manual-section").display = False
-        self.query_one("#files-section").display  = False
+        """Cache hot widgets and start the log flush timer."""
+        # Widgets touched on every log flush / run toggle, looked up once
+        self._log_widget = self.query_one("#log-area", RichLog)
+        self._status_widget = self.query_one("#status-bar", Static)
+        self._btn_generate = self.query_one("#btn-generate", Button)
+        self._btn_test = self.query_one("#btn-test", Button)
+        self._btn_cancel = self.query_one("#btn-cancel", Button)
+        self._prompt_input = self.query_one("#prompt-input", Input)
+        self._mode_select = self.query_one("#mode-select", Select)
+        self.set_interval(_LOG_FLUSH_INTERVAL, self._flush_logs)
 
     @on(Select.Changed, "#mode-select")
     def on_mode_changed(self, event: Select.Changed) -> None:
@@ -300,49 +370,66 @@ class VidGenApp(App):
         if value is Select.BLANK:
             return
         self._mode = str(value)
-        self.query_one("#auto-section").display   = self._mode == _MODE_AUTO
-        self.query_one("#manual-section").display = self._mode == _MODE_MANUAL
-        self.query_one("#files-section").display  = self._mode == _MODE_FILES
+        self.query_one("#mode-switcher", ContentSwitcher).current = f"{self._mode}-section"
 
     # ------------------------------------------------------------------
     # Thread-safe helpers
     # ------------------------------------------------------------------
 
-    def _log(self, msg: str) -> None:
-        """Progress callback: format + append to log (thread-safe)."""
-        formatted = _rich_format(msg)
-        if _STAGE_RE.search(msg):
+    def _log(self, msg: str, tag: str | None = None) -> None:
+        """Progress callback: format + queue for the next flush (thread-safe).
+
+        Markup is parsed here, on the calling thread, so a malformed line
+        can't break the flush.  *tag* prefixes the line after formatting, so
+        the memoised formatting is shared by every file of a parallel batch.
+        """
+        if tag:
+            msg = msg.lstrip("\n")
+        formatted, is_stage = _rich_format(msg)
+        if is_stage:
             self._set_status(f"⏳ {msg.strip()}")
-        if threading.get_ident() == self._thread_id:
-            self._append_log(formatted)
-        else:
-            self.call_from_thread(self._append_log, formatted)
+        line = _markup_text(formatted, msg)
+        if tag:
+            line = Text.assemble(f"{tag} │ ", line)
+        with self._log_lock:
+            self._log_queue.append(line)
+
+    def _flush_logs(self) -> None:
+        """Write all queued log lines in one go, then the latest status."""
+        with self._log_lock:
+            batch, self._log_queue = self._log_queue, deque()
+            status, self._pending_status = self._pending_status, None
+        if batch:
+            self._log_widget.write(Text("\n").join(batch))
+        if status is not None:
+            self._status_widget.update(status)
 
     def _append_log(self, msg: str) -> None:
-        self.query_one("#log-area", RichLog).write(msg)
+        """Write from the UI thread, after anything workers already queued."""
+        self._flush_logs()
+        self._log_widget.write(_markup_text(msg))
 
     def _set_status(self, msg: str) -> None:
         if threading.get_ident() == self._thread_id:
             self._update_status(msg)
         else:
-            self.call_from_thread(self._update_status, msg)
+            with self._log_lock:
+                self._pending_status = msg
 
     def _update_status(self, msg: str) -> None:
-        self.query_one("#status-bar", Static).update(msg)
+        """Show *msg* now (UI thread); any status a worker queued earlier is stale."""
+        with self._log_lock:
+            self._pending_status = None
+        self._status_widget.update(msg)
 
+    @_ui
     def _set_running(self, running: bool) -> None:
         self._running = running
-        if threading.get_ident() == self._thread_id:
-            self._update_buttons(running)
-        else:
-            self.call_from_thread(self._update_buttons, running)
-
-    def _update_buttons(self, running: bool) -> None:
-        self.query_one("#btn-generate", Button).disabled = running
-        self.query_one("#btn-test",     Button).disabled = running
-        self.query_one("#btn-cancel",   Button).disabled = not running
-        self.query_one("#prompt-input", Input).disabled  = running
-        self.query_one("#mode-select",  Select).disabled = running
+        self._btn_generate.disabled = running
+        self._btn_test.disabled     = running
+        self._btn_cancel.disabled   = not running
+        self._prompt_input.disabled = running
+        self._mode_select.disabled  = running
 
     # ------------------------------------------------------------------
     # Button / key handlers
@@ -376,12 +463,14 @@ class VidGenApp(App):
 
     def action_cancel(self) -> None:
         self._cancel_requested.set()
-        if self._pipeline:
-            self._pipeline.cancel()
+        with self._pipelines_lock:
+            pipelines = list(self._pipelines)
+        for pipeline in pipelines:
+            pipeline.cancel()
         self._append_log("[yellow]Cancelling...[/yellow]")
 
     def action_clear_log(self) -> None:
-        self.query_one("#log-area", RichLog).clear()
+        self._log_widget.clear()
 
     @on(Input.Submitted, "#prompt-input")
     def on_prompt_submit(self) -> None:
@@ -422,7 +511,9 @@ class VidGenApp(App):
                 if not raw:
                     self._err("Please enter a file or directory path.")
                     return
-                md_files = _resolve_md_paths(raw)
+                # Resolved afresh on every press: files may have been added,
+                # renamed or deleted since the last run
+                md_files = resolve_md_paths(raw)
                 if not md_files:
                     self._err(f"No .md files found at: {raw}")
                     self._append_log(
@@ -481,9 +572,8 @@ class VidGenApp(App):
         if use_placeholders:
             self._log("[yellow]Mode: Test — placeholder images, no AI calls[/yellow]")
         else:
-            has_hf = bool(self._config.hf_token)
             self._log(
-                f"[dim]HF token: {'✓ found' if has_hf else '✗ missing — will use placeholders'}[/dim]"
+                f"[dim]HF token: {'✓ found' if self._has_hf else '✗ missing — will use placeholders'}[/dim]"
             )
 
         self._log("")
@@ -500,25 +590,27 @@ class VidGenApp(App):
         self._log("=" * 60)
         self._log("")
 
-        self._pipeline = Pipeline(
+        pipeline = Pipeline(
             config=self._config,
             progress_cb=self._log,
             use_placeholders=use_placeholders,
         )
         if scenes is not None:
-            self._pipeline.inject_scenes(scenes, settings=settings)
+            pipeline.inject_scenes(scenes, settings=settings)
+        with self._pipelines_lock:
+            self._pipelines.add(pipeline)
 
         thread = threading.Thread(
             target=self._run_single_thread,
-            args=(prompt,),
+            args=(pipeline, prompt),
             daemon=True,
         )
         thread.start()
 
-    def _run_single_thread(self, prompt: str) -> None:
+    def _run_single_thread(self, pipeline: Pipeline, prompt: str) -> None:
         try:
             self._set_status("⏳ Pipeline running…")
-            output = self._pipeline.run(prompt)
+            output = pipeline.run(prompt)
             self._set_status(f"✅  Done → {output}")
             self._log(f"[bold green]🎉 Video saved to: {output}[/bold green]")
         except PipelineCancelled:
@@ -528,8 +620,9 @@ class VidGenApp(App):
             self._set_status(f"❌  Error: {e}")
             self._log(f"[bold red]Error: {e}[/bold red]")
         finally:
+            with self._pipelines_lock:
+                self._pipelines.discard(pipeline)
             self._set_running(False)
-            self._pipeline = None
 
     # ------------------------------------------------------------------
     # Multi-file markdown pipeline
@@ -550,9 +643,8 @@ class VidGenApp(App):
         if use_placeholders:
             self._log("[yellow]Test mode — placeholder images, no AI calls[/yellow]")
         else:
-            has_hf = bool(self._config.hf_token)
             self._log(
-                f"[dim]HF token: {'✓ found' if has_hf else '✗ missing — will use placeholders'}[/dim]"
+                f"[dim]HF token: {'✓ found' if self._has_hf else '✗ missing — will use placeholders'}[/dim]"
             )
         self._log("=" * 60)
         self._log("")
@@ -569,53 +661,36 @@ class VidGenApp(App):
     ) -> None:
         outputs: list[Path] = []
         errors: list[str] = []
-
-        for idx, md_path in enumerate(md_files, 1):
-            if self._cancel_requested.is_set():
-                self._log("[yellow]Cancelled before processing remaining files.[/yellow]")
-                break
-
-            self._log(f"\n[bold blue]📄 File {idx}/{len(md_files)}: {md_path.name}[/bold blue]")
-            self._set_status(f"⏳ File {idx}/{len(md_files)}: {md_path.name}")
-
-            # Parse markdown
-            try:
-                md_text = md_path.read_text(encoding="utf-8")
-                title, scenes, settings = parse_markdown_story(md_text)
-            except Exception as e:
-                msg = f"Parse error in {md_path.name}: {e}"
-                self._log(f"[red]  ✗ {msg}[/red]")
-                errors.append(msg)
-                continue
-
-            if title:
-                self._log(f"[dim]  Title: {title}[/dim]")
-            self._log(f"[dim]  {len(scenes)} scenes found[/dim]")
-
-            # Build and run pipeline — use title as prompt for music mood
-            self._pipeline = Pipeline(
-                config=self._config,
-                progress_cb=self._log,
-                use_placeholders=use_placeholders,
-            )
-            self._pipeline.inject_scenes(scenes, settings=settings)
-
-            prompt_for_mood = title or md_path.stem.replace("_", " ").replace("-", " ")
-
-            try:
-                output = self._pipeline.run(prompt_for_mood)
-                outputs.append(output)
-                self._log(f"[bold green]  ✓ Video: {output}[/bold green]")
-            except PipelineCancelled:
-                self._log("[yellow]  Pipeline cancelled.[/yellow]")
-                self._cancel_requested.set()
-                break
-            except Exception as e:
-                msg = f"Pipeline error for {md_path.name}: {e}"
-                self._log(f"[bold red]  ✗ {msg}[/bold red]")
-                errors.append(msg)
-            finally:
-                self._pipeline = None
+        workers = max(1, min(self._config.max_parallel, len(md_files)))
+        total = len(md_files)
+
+        if workers > 1:
+            self._log(f"[dim]Processing up to {workers} files in parallel[/dim]")
+        self._set_status(f"⏳ {total} file{'s' if total != 1 else ''} queued")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vidgen-md") as pool:
+            futures: dict[Future, Path] = {
+                pool.submit(
+                    self._run_file, idx, total, md_path, use_placeholders, workers > 1
+                ): md_path
+                for idx, md_path in enumerate(md_files, 1)
+            }
+            done = 0
+            for future in as_completed(futures):
+                md_path = futures[future]
+                done += 1
+                try:
+                    output = future.result()
+                except PipelineCancelled:
+                    self._cancel_requested.set()
+                    continue
+                except Exception as e:
+                    errors.append(f"{md_path.name}: {e}")
+                    continue
+                if output is not None:
+                    outputs.append(output)
+                if not self._cancel_requested.is_set():
+                    self._set_status(f"⏳ {done}/{total} files finished")
 
         # Summary
         self._log("\n" + "=" * 60)
@@ -638,3 +713,64 @@ class VidGenApp(App):
         self._set_status(status)
         self._set_running(False)
 
+    def _run_file(
+        self,
+        idx: int,
+        total: int,
+        md_path: Path,
+        use_placeholders: bool,
+        parallel: bool,
+    ) -> Path | None:
+        """Parse and render one markdown file; runs on a pool thread.
+
+        Returns the video path, or None if skipped because of a cancel.
+        Raises on parse or pipeline errors so the caller can tally them.
+        """
+        if self._cancel_requested.is_set():
+            return None
+
+        # Interleaved output from several files needs a per-file tag
+        log = partial(self._log, tag=md_path.stem if parallel else None)
+
+        log(f"\n[bold blue]📄 File {idx}/{total}: {md_path.name}[/bold blue]")
+
+        try:
+            md_text = md_path.read_text(encoding="utf-8")
+            title, scenes, settings = parse_markdown_story(md_text)
+        except Exception as e:
+            log(f"[red]  ✗ Parse error in {md_path.name}: {e}[/red]")
+            raise
+
+        if title:
+            log(f"[dim]  Title: {title}[/dim]")
+        log(f"[dim]  {len(scenes)} scenes found[/dim]")
+
+        # Build and run pipeline — use title as prompt for music mood
+        pipeline = Pipeline(
+            config=self._config,
+            progress_cb=log,
+            use_placeholders=use_placeholders,
+        )
+        pipeline.inject_scenes(scenes, settings=settings)
+        with self._pipelines_lock:
+            if self._cancel_requested.is_set():
+                return None
+            self._pipelines.add(pipeline)
+
+        prompt_for_mood = title or md_path.stem.replace("_", " ").replace("-", " ")
+
+        try:
+            output = pipeline.run(prompt_for_mood)
+        except PipelineCancelled:
+            log("[yellow]  Pipeline cancelled.[/yellow]")
+            raise
+        except Exception as e:
+            log(f"[bold red]  ✗ Pipeline error for {md_path.name}: {e}[/bold red]")
+            raise
+        finally:
+            with self._pipelines_lock:
+                self._pipelines.discard(pipeline)
+
+        log(f"[bold green]  ✓ Video: {output}[/bold green]")
+        return output
+
@@ -1,33 +1,189 @@
 """HuggingFace video generation (image-to-video) with retry."""
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
+import os
+import shutil
+import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from .config import MAX_RETRIES, RETRY_DELAY, VIDEO_MODEL, Config
+from .config import MAX_CONCURRENT_HF, MAX_RETRIES, VIDEO_MODEL, Config, retry_delay
+
+if TYPE_CHECKING:
+    from huggingface_hub import AsyncInferenceClient
 
 log = logging.getLogger(__name__)
 
+# Hardware H.264 encoders in order of preference, with the flags each needs.
+# VAAPI is left out: it needs a device path and an hwupload filter chain.
+_HW_H264_ENCODERS: dict[str, list[str]] = {
+    "h264_nvenc": ["-preset", "p1", "-tune", "ll"],
+    "h264_videotoolbox": ["-b:v", "4M"],
+}
+_SW_H264_ARGS = ["-c:v", "libx264"]
+
+# Clips rendered per batched ffmpeg run.  Each output holds an encoder
+# session, and consumer NVENC drivers allow only a few (3 on older ones).
+PLACEHOLDER_BATCH_SIZE = 3
+
+# Hardware encoders that were listed by ffmpeg but failed to open (no GPU,
+# driver mismatch); they are not tried again in this process.
+_broken_encoders: set[str] = set()
+
+
+class _ModelUnavailable(Exception):
+    """The model is not served by the HF serverless API; retrying is pointless."""
 
-def _call_hf_img2vid(
+
+async def _acall_hf_img2vid(
+    client: "AsyncInferenceClient",
     image_path: Path,
     model: str,
-    token: str,
-) -> bytes:
-    """Call HF Inference API for image-to-video. Returns raw video bytes."""
-    from huggingface_hub import InferenceClient
-
-    client = InferenceClient(model=model, token=token)
-    with open(image_path, "rb") as f:
-        image_bytes = f.read()
-    result = client.image_to_video(image_bytes)
+) -> bytes | Path:
+    """Call HF Inference API for image-to-video.
+
+    Returns the raw video bytes, or the path of a file the client already
+    wrote the video to.
+    """
+    try:
+        # Hand over the path so huggingface_hub reads the file itself rather
+        # than us holding a second copy of the image
+        result = await client.image_to_video(image_path)
+    except RuntimeError as e:
+        # huggingface_hub raises StopIteration when no provider serves the
+        # model; escaping its coroutine turns that into a RuntimeError
+        # (PEP 479) with the StopIteration kept as the cause.
+        if not isinstance(e.__cause__, StopIteration):
+            raise
+        raise _ModelUnavailable(
+            f"Model {model} not available on HF serverless API"
+        ) from e
     # Result may be bytes or a path-like
     if isinstance(result, (bytes, bytearray)):
         return bytes(result)
-    # If it returned a path
-    return Path(result).read_bytes()
+    return Path(result)
+
+
+def _install_video(video: bytes | Path, output_path: Path) -> None:
+    """Atomically place a generated clip at *output_path*.
+
+    Data is staged in a temp file beside the target and renamed over it, so
+    a crash never leaves a truncated clip behind.  A file result is renamed
+    straight into place; across filesystems it is copied with
+    shutil.copyfile, which uses sendfile(2) on Linux and stays in the kernel.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(video, Path):
+        try:
+            os.replace(video, output_path)
+            return
+        except OSError:
+            pass  # different filesystem — copy below
+
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, suffix=".part")
+    try:
+        if isinstance(video, Path):
+            os.close(fd)
+            shutil.copyfile(video, tmp_name)
+        else:
+            with os.fdopen(fd, "wb") as f:
+                f.write(video)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    if isinstance(video, Path):
+        video.unlink(missing_ok=True)
+
+
+async def _generate_videos_async(
+    image_paths: list[Path],
+    output_paths: list[Path],
+    config: Config,
+    progress_cb: Callable[[str], None] | None,
+    is_cancelled: Callable[[], bool] | None,
+) -> list[Path | BaseException]:
+    from huggingface_hub import AsyncInferenceClient
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT_HF)
+    # One client for the whole batch: scenes share its connection pool.  Not
+    # cached beyond that — its session is bound to this event loop.
+    client = AsyncInferenceClient(model=VIDEO_MODEL, token=config.hf_token)
+    unavailable: list[_ModelUnavailable] = []
+
+    async def _one(image_path: Path, output_path: Path) -> Path:
+        for attempt in range(1, MAX_RETRIES + 1):
+            # Hold a slot only while a request is in flight: the backoff
+            # sleep below must not keep healthy scenes queued behind this one
+            async with sem:
+                if unavailable:
+                    raise RuntimeError(str(unavailable[0]))
+                if is_cancelled and is_cancelled():
+                    raise RuntimeError("cancelled")
+                try:
+                    if progress_cb:
+                        progress_cb(
+                            f"  Video gen: {image_path.name} via {VIDEO_MODEL} "
+                            f"(attempt {attempt}/{MAX_RETRIES})"
+                        )
+                    log.info("Generating video from %s (attempt %d)", image_path, attempt)
+
+                    video = await _acall_hf_img2vid(
+                        client,
+                        image_path=image_path,
+                        model=VIDEO_MODEL,
+                    )
+
+                    await asyncio.to_thread(_install_video, video, output_path)
+                    log.info("Saved video clip to %s", output_path)
+                    return output_path
+
+                except _ModelUnavailable as e:
+                    # Report once; the other scenes bail out on their next attempt
+                    if not unavailable:
+                        unavailable.append(e)
+                        log.warning("%s", e)
+                        if progress_cb:
+                            progress_cb(f"  ⚠ {e} — will use Ken Burns effect instead")
+                    raise RuntimeError(str(e))
+                except Exception as e:
+                    log.warning("Video gen failed for %s (attempt %d): %s", image_path, attempt, e)
+                    if progress_cb:
+                        progress_cb(f"  ⚠ Video gen failed (attempt {attempt}): {e}")
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(retry_delay(attempt))
+
+        raise RuntimeError(f"Video generation failed after {MAX_RETRIES} attempts for {image_path}")
+
+    try:
+        return await asyncio.gather(
+            *(_one(i, o) for i, o in zip(image_paths, output_paths)),
+            return_exceptions=True,
+        )
+    finally:
+        await client.close()
+
+
+def generate_videos_batch(
+    image_paths: list[Path],
+    output_paths: list[Path],
+    config: Config,
+    progress_cb: Callable[[str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> list[Path | BaseException]:
+    """Animate several stills concurrently in one event loop.
+
+    Up to MAX_CONCURRENT_HF requests are in flight at once, each retried up
+    to MAX_RETRIES times. Returns a list aligned with *image_paths*: the
+    output path on success, otherwise the exception for that clip.
+    """
+    return asyncio.run(
+        _generate_videos_async(image_paths, output_paths, config, progress_cb, is_cancelled)
+    )
 
 
 def generate_video(
@@ -41,38 +197,36 @@ def generate_video(
     Uses stable-video-diffusion-img2vid-xt via HF API.
     Retries up to MAX_RETRIES on failure.
     """
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            if progress_cb:
-                progress_cb(f"  Video gen: {VIDEO_MODEL} (attempt {attempt}/{MAX_RETRIES})")
-            log.info("Generating video from %s (attempt %d)", image_path, attempt)
-
-            vid_bytes = _call_hf_img2vid(
-                image_path=image_path,
-                model=VIDEO_MODEL,
-                token=config.hf_token,
-            )
+    (result,) = generate_videos_batch([image_path], [output_path], config, progress_cb)
+    if isinstance(result, BaseException):
+        raise result
+    return result
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(vid_bytes)
-            log.info("Saved video clip to %s", output_path)
-            return output_path
-
-        except StopIteration:
-            # Model not available on the serverless inference API — no point retrying
-            msg = f"Model {VIDEO_MODEL} not available on HF serverless API"
-            log.warning(msg)
-            if progress_cb:
-                progress_cb(f"  ⚠ {msg} — will use Ken Burns effect instead")
-            raise RuntimeError(msg)
-        except Exception as e:
-            log.warning("Video gen failed (attempt %d): %s", attempt, e)
-            if progress_cb:
-                progress_cb(f"  ⚠ Video gen failed (attempt {attempt}): {e}")
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY)
 
-    raise RuntimeError(f"Video generation failed after {MAX_RETRIES} attempts for {image_path}")
+@lru_cache(maxsize=1)
+def _hw_h264_encoder() -> str | None:
+    """Name of the first hardware H.264 encoder this ffmpeg build offers."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    listed = result.stdout
+    for name in _HW_H264_ENCODERS:
+        if f" {name} " in listed:
+            log.info("Using hardware H.264 encoder %s", name)
+            return name
+    return None
+
+
+def _h264_encoder_args() -> list[str]:
+    """``-c:v`` arguments for the fastest usable H.264 encoder."""
+    name = _hw_h264_encoder()
+    if name is None or name in _broken_encoders:
+        return _SW_H264_ARGS
+    return ["-c:v", name, *_HW_H264_ENCODERS[name]]
 
 
 def generate_placeholder_video(
@@ -82,28 +236,35 @@ def generate_placeholder_video(
 ) -> Path:
     """Create a placeholder video from a still image using ffmpeg (no API).
 
-    Applies a gentle zoom for visual interest.
+    Applies a gentle zoom for visual interest. Encodes on the GPU when
+    ffmpeg has a hardware H.264 encoder, falling back to libx264.
     """
-    import subprocess
-
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     frames = int(duration * 30)
-    cmd = [
-        "ffmpeg", "-y",
-        "-loop", "1", "-i", str(image_path),
-        "-t", str(duration),
-        "-vf", (
-            f"scale=1200x2134,zoompan=z='min(zoom+0.002,1.08)'"
-            f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
-            f":d={frames}:s=1080x1920:fps=30"
-        ),
-        "-c:v", "libx264", "-pix_fmt", "yuv420p",
-        "-r", "30",
-        str(output_path),
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, timeout=120)
+    vf = (
+        f"scale=1080x1920,zoompan=z='min(zoom+0.002,1.08)'"
+        f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+        f":d={frames}:s=1080x1920:fps=30"
+    )
+
+    def _zoom_cmd(encoder_args: list[str]) -> list[str]:
+        return [
+            "ffmpeg", "-y",
+            "-loop", "1", "-i", str(image_path),
+            "-t", str(duration),
+            "-vf", vf,
+            *encoder_args, "-pix_fmt", "yuv420p",
+            "-r", "30",
+            str(output_path),
+        ]
+
+    encoder_args = _h264_encoder_args()
+    result = subprocess.run(_zoom_cmd(encoder_args), capture_output=True, timeout=120)
+    if result.returncode != 0 and encoder_args is not _SW_H264_ARGS:
+        log.warning("Hardware encoder %s failed; falling back to libx264", encoder_args[1])
+        _broken_encoders.add(encoder_args[1])
+        result = subprocess.run(_zoom_cmd(_SW_H264_ARGS), capture_output=True, timeout=120)
     if result.returncode != 0:
         # Fallback: simple static frame video
         cmd2 = [
@@ -117,3 +278,93 @@ def generate_placeholder_video(
         ]
         subprocess.run(cmd2, capture_output=True, check=True, timeout=120)
     return output_path
+
+
+def _render_placeholder_chunk(
+    image_paths: list[Path],
+    output_paths: list[Path],
+    durations: list[float],
+) -> list[Path | BaseException]:
+    """Render a few placeholder clips with a single ffmpeg process.
+
+    One ``-loop 1 -i`` input and one zoompan branch per clip in a shared
+    filter graph, each mapped to its own output file. If the batched run
+    fails, every clip is retried on its own through
+    generate_placeholder_video.
+    """
+    if len(image_paths) == 1:
+        try:
+            return [generate_placeholder_video(image_paths[0], output_paths[0], durations[0])]
+        except Exception as e:
+            return [e]
+
+    for out in output_paths:
+        out.parent.mkdir(parents=True, exist_ok=True)
+
+    cmd = ["ffmpeg", "-y"]
+    graph: list[str] = []
+    for i, (img, duration) in enumerate(zip(image_paths, durations)):
+        cmd += ["-loop", "1", "-t", str(duration), "-i", str(img)]
+        frames = int(duration * 30)
+        graph.append(
+            f"[{i}:v]scale=1080x1920,zoompan=z='min(zoom+0.002,1.08)'"
+            f":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":d={frames}:s=1080x1920:fps=30[v{i}]"
+        )
+    cmd += ["-filter_complex", ";".join(graph)]
+    encoder_args = _h264_encoder_args()
+    for i, (out, duration) in enumerate(zip(output_paths, durations)):
+        cmd += [
+            "-map", f"[v{i}]", "-t", str(duration),
+            *encoder_args, "-pix_fmt", "yuv420p", "-r", "30",
+            str(out),
+        ]
+
+    timeout = 120 + 30 * len(image_paths)
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+        ok = result.returncode == 0
+        if not ok:
+            log.warning(
+                "Batched placeholder render failed, rendering clips one by one: %s",
+                result.stderr.decode(errors="replace")[-300:],
+            )
+    except subprocess.TimeoutExpired:
+        log.warning("Batched placeholder render timed out, rendering clips one by one")
+        ok = False
+    if ok:
+        return list(output_paths)
+
+    results: list[Path | BaseException] = []
+    for img, out, duration in zip(image_paths, output_paths, durations):
+        try:
+            results.append(generate_placeholder_video(img, out, duration))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def generate_placeholder_videos_batch(
+    image_paths: list[Path],
+    output_paths: list[Path],
+    durations: list[float],
+    is_cancelled: Callable[[], bool] | None = None,
+) -> list[Path | BaseException]:
+    """Create placeholder clips a few at a time, one ffmpeg process per batch.
+
+    Batches hold at most PLACEHOLDER_BATCH_SIZE clips: every output of a
+    process opens its own encoder session, and consumer NVENC drivers
+    refuse more than a handful. *is_cancelled* is checked between batches.
+    Returns a list aligned with *image_paths*: the output path on success,
+    otherwise the exception for that clip.
+    """
+    results: list[Path | BaseException] = []
+    for start in range(0, len(image_paths), PLACEHOLDER_BATCH_SIZE):
+        if is_cancelled and is_cancelled():
+            results += [RuntimeError("cancelled")] * (len(image_paths) - start)
+            break
+        end = start + PLACEHOLDER_BATCH_SIZE
+        results += _render_placeholder_chunk(
+            image_paths[start:end], output_paths[start:end], durations[start:end],
+        )
+    return results